@@ -0,0 +1,139 @@
+# app/api/arrow.py
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+import annotated_types
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from app.api.schemas import LoanApplicationRequest
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Column layout of an Arrow batch request (mirrors LoanApplicationRequest)
+REQUEST_SCHEMA = pa.schema(
+    [
+        pa.field("annual_inc", pa.float64(), nullable=False),
+        pa.field("int_rate", pa.float64(), nullable=False),
+        pa.field("credit_history_length", pa.float64(), nullable=False),
+        pa.field("total_rev_hi_lim", pa.float64()),
+        pa.field("tot_cur_bal", pa.float64()),
+        pa.field("purpose", pa.string(), nullable=False),
+        pa.field("loan_burden", pa.float64()),
+        pa.field("revol_util", pa.float64()),
+        pa.field("verification_status", pa.string(), nullable=False),
+        pa.field("loan_amount", pa.float64()),
+    ]
+)
+
+# Column layout of an Arrow batch response (mirrors CreditScoreResponse)
+RESPONSE_SCHEMA = pa.schema(
+    [
+        pa.field("credit_score", pa.float64(), nullable=False),
+        pa.field("default_probability", pa.float64(), nullable=False),
+        pa.field("risk_level", pa.string(), nullable=False),
+        pa.field("log_odds", pa.float64()),
+        pa.field("message", pa.string()),
+    ]
+)
+
+
+def describe_schema(schema: pa.Schema) -> List[Dict[str, object]]:
+    """JSON-friendly description of an Arrow schema"""
+    return [
+        {"name": f.name, "type": str(f.type), "nullable": f.nullable} for f in schema
+    ]
+
+
+def read_applications(body: bytes) -> pd.DataFrame:
+    """Decode an Arrow IPC stream into a DataFrame laid out as REQUEST_SCHEMA"""
+    try:
+        table = pa.ipc.open_stream(body).read_all()
+        columns = []
+        for field in REQUEST_SCHEMA:
+            if field.name in table.column_names:
+                columns.append(table.column(field.name).cast(field.type))
+            elif field.nullable:
+                columns.append(pa.nulls(table.num_rows, field.type))
+            else:
+                raise ValueError(f"Missing required column: {field.name}")
+    except pa.ArrowException as e:
+        raise ValueError(f"Invalid Arrow payload: {e}") from e
+    return pa.Table.from_arrays(columns, schema=REQUEST_SCHEMA).to_pandas()
+
+
+def _field_bounds(name: str) -> Tuple[float, float, bool, bool]:
+    """(lower, upper, lower_is_strict, upper_is_strict) for a numeric field"""
+    # annotated_types only promises comparable bounds; ours are all numbers
+    lower: Any = -np.inf
+    upper: Any = np.inf
+    strict_lower = strict_upper = False
+    for constraint in LoanApplicationRequest.model_fields[name].metadata:
+        if isinstance(constraint, annotated_types.Gt):
+            lower, strict_lower = constraint.gt, True
+        elif isinstance(constraint, annotated_types.Ge):
+            lower, strict_lower = constraint.ge, False
+        elif isinstance(constraint, annotated_types.Lt):
+            upper, strict_upper = constraint.lt, True
+        elif isinstance(constraint, annotated_types.Le):
+            upper, strict_upper = constraint.le, False
+    return float(lower), float(upper), strict_lower, strict_upper
+
+
+def _enum_values(name: str) -> List[str]:
+    """Allowed values of an enum-typed LoanApplicationRequest field"""
+    annotation = LoanApplicationRequest.model_fields[name].annotation
+    if not (isinstance(annotation, type) and issubclass(annotation, Enum)):
+        raise TypeError(f"{name} is not an enum field")
+    return [member.value for member in annotation]
+
+
+# Validation tables, read once from the LoanApplicationRequest constraints
+NUMERIC_COLUMNS = [f.name for f in REQUEST_SCHEMA if pa.types.is_floating(f.type)]
+CATEGORICAL_COLUMNS = [f.name for f in REQUEST_SCHEMA if pa.types.is_string(f.type)]
+_BOUNDS = np.array([_field_bounds(n)[:2] for n in NUMERIC_COLUMNS], dtype=np.float64)
+_STRICT = np.array([_field_bounds(n)[2:] for n in NUMERIC_COLUMNS], dtype=bool)
+_REQUIRED = np.array(
+    [not REQUEST_SCHEMA.field(n).nullable for n in NUMERIC_COLUMNS], dtype=bool
+)
+_ALLOWED = {n: _enum_values(n) for n in CATEGORICAL_COLUMNS}
+_MESSAGES = np.array(
+    [f"Invalid value for {n}" for n in NUMERIC_COLUMNS + CATEGORICAL_COLUMNS],
+    dtype=object,
+)
+# Entry reported for valid rows
+_NO_ERROR = np.array(None, dtype=object)
+
+
+def validate_applications(df: pd.DataFrame) -> np.ndarray:
+    """Check every row against the LoanApplicationRequest constraints at once
+
+    Returns an object array holding an error message for invalid rows and None
+    for valid ones. Numeric bounds are checked in one pass over the stacked
+    (rows x fields) matrix instead of building one Pydantic model per row.
+    """
+    X = df[NUMERIC_COLUMNS].to_numpy(dtype=np.float64)
+    present = ~np.isnan(X)
+    with np.errstate(invalid="ignore"):
+        above = np.where(_STRICT[:, 0], X > _BOUNDS[:, 0], X >= _BOUNDS[:, 0])
+        below = np.where(_STRICT[:, 1], X < _BOUNDS[:, 1], X <= _BOUNDS[:, 1])
+    numeric_bad = np.where(present, ~(above & below), _REQUIRED)
+
+    # Categorical columns are required and must be a known enum value
+    categorical_bad = np.column_stack(
+        [~df[n].isin(_ALLOWED[n]).to_numpy() for n in CATEGORICAL_COLUMNS]
+    )
+
+    bad = np.hstack([numeric_bad, categorical_bad])
+    invalid = bad.any(axis=1)
+    return np.where(invalid, _MESSAGES[bad.argmax(axis=1)], _NO_ERROR)
+
+
+def write_predictions(rows: List[Dict[str, Optional[object]]]) -> bytes:
+    """Encode prediction dicts as an Arrow IPC stream laid out as RESPONSE_SCHEMA"""
+    table = pa.Table.from_pylist(rows, schema=RESPONSE_SCHEMA)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, RESPONSE_SCHEMA) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -1,7 +1,21 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+import json
 import logging
 import time
-from datetime import datetime
+
+import pandas as pd
+
+from app.api.arrow import (
+    ARROW_STREAM_MEDIA_TYPE,
+    REQUEST_SCHEMA,
+    RESPONSE_SCHEMA,
+    describe_schema,
+    read_applications,
+    validate_applications,
+    write_predictions,
+)
 from app.api.schemas import (
     LoanApplicationRequest,
     CreditScoreResponse,
@@ -11,43 +25,79 @@ from app.api.schemas import (
     BatchPredictionResponse,
 )
 from app.utils.helpers import get_model_instance, CreditRiskService
+from app.utils.batcher import get_batcher_instance
+from app.utils.workers import PROCESS_POOL_THRESHOLD, predict_in_pool
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_model() -> CreditRiskService:
-    return get_model_instance()
+# Reported for applications that could not be scored; copied with the message
+_ERR = CreditScoreResponse.model_construct(
+    credit_score=0.0,
+    default_probability=1.0,
+    risk_level="Error",
+    log_odds=None,
+    message="",
+)
+_ERR_ROW = _ERR.model_dump()
+
+
+def _error_row(message: str) -> dict:
+    """Prediction row reported for an application that could not be scored"""
+    return {**_ERR_ROW, "message": message}
+
+
+def get_model(request: Request) -> CreditRiskService:
+    # Loaded once in the app lifespan; fall back to loading it on first use.
+    # Handlers call this directly rather than through Depends, which would add
+    # a dependency-resolution step to every request
+    model = getattr(request.app.state, "model", None)
+    if model is None:
+        model = get_model_instance()
+    return model
+
+
+# Load balancers poll /health often; serve a cached response for this long
+HEALTH_CACHE_TTL = 1.0
+_health_cache: dict = {"t": float("-inf"), "resp": None}
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(request: Request):
+    now = time.monotonic()
+    if now - _health_cache["t"] < HEALTH_CACHE_TTL:
+        return _health_cache["resp"]
+
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
     try:
-        model = get_model()
-        return HealthResponse(
+        model = get_model(request)
+        resp = HealthResponse(
             status="healthy",
             model_loaded=True,
-            version=model.metadata.get("version", "1.0.0"),
-            timestamp=datetime.now().isoformat(),
+            version=model.version,
+            timestamp=timestamp,
         )
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return HealthResponse(
+        resp = HealthResponse(
             status="unhealthy",
             model_loaded=False,
             version="unknown",
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp,
         )
+    _health_cache.update(t=now, resp=resp)
+    return resp
 
 
 @router.post("/predict", response_model=CreditScoreResponse)
-async def predict_credit_score(
-    request: LoanApplicationRequest, model: CreditRiskService = Depends(get_model)
-):
+async def predict_credit_score(request: LoanApplicationRequest, http_request: Request):
+    model = get_model(http_request)
     try:
         start = time.time()
-        result = model.predict(request.dict())
-        return CreditScoreResponse(
+        result = await get_batcher_instance().submit(model, request.model_dump())
+        # Outputs come from our own model, so skip re-validating them
+        return CreditScoreResponse.model_construct(
             **result, message=f"Prediction completed in {time.time() - start:.3f}s"
         )
     except Exception as e:
@@ -57,37 +107,108 @@ async def predict_credit_score(
 
 @router.post("/predict/batch", response_model=BatchPredictionResponse)
 async def predict_batch(
-    request: BatchPredictionRequest, model: CreditRiskService = Depends(get_model)
+    request: BatchPredictionRequest,
+    http_request: Request,
 ):
+    model = get_model(http_request)
     start = time.time()
+    records = request.model_dump()["applications"]
+    pool = getattr(http_request.app.state, "pool", None)
+    try:
+        if pool is not None and len(records) > PROCESS_POOL_THRESHOLD:
+            outcomes = await predict_in_pool(pool, records)
+        else:
+            outcomes = await run_in_threadpool(model.predict_many, records)
+    except Exception as e:
+        logger.error(f"Batch prediction failed: {str(e)}")
+        outcomes = [e] * len(request.applications)
+
+    # Outputs come from our own model, so skip re-validating them
     results = []
-    for app in request.applications:
-        try:
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            results.append(_ERR.model_copy(update={"message": str(outcome)}))
+        else:
             results.append(
-                CreditScoreResponse(
-                    **model.predict(app.dict()), message="Batch prediction completed"
-                )
-            )
-        except Exception as e:
-            results.append(
-                CreditScoreResponse(
-                    credit_score=0,
-                    default_probability=1,
-                    risk_level="Error",
-                    log_odds=None,
-                    message=str(e),
+                CreditScoreResponse.model_construct(
+                    **outcome, message="Batch prediction completed"
                 )
             )
     processing_time = time.time() - start
-    return BatchPredictionResponse(
+    response = BatchPredictionResponse.model_construct(
         predictions=results,
         total_applications=len(request.applications),
         processing_time=processing_time,
     )
+    # Serialize once in pydantic-core and skip FastAPI's response re-validation
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@router.post("/predict/batch/stream")
+async def predict_batch_stream(request: BatchPredictionRequest, http_request: Request):
+    """Stream batch predictions as NDJSON, one line per application"""
+    model = get_model(http_request)
+    records = request.model_dump()["applications"]
+
+    def lines():
+        sent = 0
+        try:
+            for outcome in model.predict_many_iter(records):
+                if isinstance(outcome, Exception):
+                    row = _error_row(str(outcome))
+                else:
+                    row = {**outcome, "message": None}
+                yield json.dumps(row) + "\n"
+                sent += 1
+        except Exception as e:
+            logger.error(f"Streaming batch prediction failed: {str(e)}")
+            for _ in range(len(records) - sent):
+                yield json.dumps(_error_row(str(e))) + "\n"
+
+    # Sync generators are iterated in the threadpool, off the event loop
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/predict/batch/arrow")
+async def predict_batch_arrow(request: Request):
+    """Score an Arrow IPC stream of applications and answer with an Arrow stream"""
+    model = get_model(request)
+    try:
+        df = read_applications(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    errors = validate_applications(df)
+    valid = pd.isna(errors)
+    try:
+        outcomes = iter(await run_in_threadpool(model.predict_many, df[valid]))
+    except Exception as e:
+        logger.error(f"Arrow batch prediction failed: {str(e)}")
+        outcomes = iter([e] * int(valid.sum()))
+
+    rows = []
+    for error in errors:
+        outcome = next(outcomes) if error is None else ValueError(error)
+        if isinstance(outcome, Exception):
+            rows.append(_error_row(str(outcome)))
+        else:
+            rows.append({**outcome, "message": None})
+    return Response(content=write_predictions(rows), media_type=ARROW_STREAM_MEDIA_TYPE)
+
+
+@router.get("/predict/batch/arrow/schema")
+async def get_arrow_batch_schema():
+    """Describe the Arrow request and response layouts for /predict/batch/arrow"""
+    return {
+        "media_type": ARROW_STREAM_MEDIA_TYPE,
+        "request": describe_schema(REQUEST_SCHEMA),
+        "response": describe_schema(RESPONSE_SCHEMA),
+    }
 
 
 @router.get("/model/info", response_model=ModelInfoResponse)
-async def get_model_info(model: CreditRiskService = Depends(get_model)):
+async def get_model_info(request: Request):
+    model = get_model(request)
     return ModelInfoResponse(
         model_type="Logistic Regression with WOE pipeline",
         features_used=model.metadata.get("features", []),
@@ -98,3 +219,10 @@ async def get_model_info(model: CreditRiskService = Depends(get_model)):
         },
         training_date=model.metadata.get("training_date"),
     )
+
+
+@router.get("/metrics")
+async def get_metrics(request: Request):
+    """Serving counters, currently the prediction cache hit rate"""
+    model = get_model(request)
+    return {"prediction_cache": model.cache.stats()}
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from enum import Enum
 
@@ -25,10 +25,12 @@ class VerificationStatus(str, Enum):
 class LoanApplicationRequest(BaseModel):
     """Request model for loan application"""
 
-    annual_inc: float = Field(..., description="Annual income in USD", gt=0)
+    annual_inc: float = Field(
+        ..., description="Annual income in USD", gt=0, le=10_000_000
+    )
     int_rate: float = Field(..., description="Interest rate percentage", ge=0, le=50)
     credit_history_length: float = Field(
-        ..., description="Credit history length in years", ge=0
+        ..., description="Credit history length in years", ge=0, le=100
     )
     total_rev_hi_lim: Optional[float] = Field(
         None, description="Total revolving high limit", ge=0
@@ -46,28 +48,6 @@ class LoanApplicationRequest(BaseModel):
     )
     loan_amount: Optional[float] = Field(None, description="Loan amount in USD", gt=0)
 
-    @field_validator("annual_inc")
-    def validate_annual_income(cls, v):
-        if v <= 0:
-            raise ValueError("Annual income must be positive")
-        if v > 10000000:  # 10 million
-            raise ValueError("Annual income seems unreasonably high")
-        return v
-
-    @field_validator("int_rate")
-    def validate_interest_rate(cls, v):
-        if v < 0 or v > 50:
-            raise ValueError("Interest rate must be between 0 and 50 percent")
-        return v
-
-    @field_validator("credit_history_length")
-    def validate_credit_history(cls, v):
-        if v < 0:
-            raise ValueError("Credit history length cannot be negative")
-        if v > 100:  # 100 years seems unreasonable
-            raise ValueError("Credit history length seems unreasonably high")
-        return v
-
 
 class CreditScoreResponse(BaseModel):
     """Response model for credit score prediction"""
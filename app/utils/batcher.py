@@ -0,0 +1,111 @@
+# app/utils/batcher.py
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+
+class _Window:
+    """Applications collected for one service while the batch window is open"""
+
+    def __init__(self):
+        self.items: List[Tuple[dict, asyncio.Future]] = []
+        self.full = asyncio.Event()
+
+
+class AsyncBatcher:
+    """Groups concurrent single predictions into one vectorized predict_many call
+
+    The first request to arrive opens a window and waits up to ``max_wait_ms``
+    (or until ``max_batch_size`` requests have joined), then scores the whole
+    window at once and hands every caller its own result.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._windows: Dict[Any, _Window] = {}
+        # Running flushes, referenced so they are not collected mid-flight
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, service: Any, record: dict) -> dict:
+        """Queue one application for scoring and wait for its result"""
+        if self.max_batch_size <= 1 or self.max_wait <= 0:
+            outcomes = await run_in_threadpool(service.predict_many, [record])
+            return self._unwrap(outcomes[0])
+
+        future = asyncio.get_running_loop().create_future()
+        window = self._windows.get(service)
+        is_leader = window is None
+        if window is None:
+            window = self._windows[service] = _Window()
+
+        window.items.append((record, future))
+        if len(window.items) >= self.max_batch_size:
+            self._close(service, window)
+            window.full.set()
+
+        if is_leader:
+            try:
+                await asyncio.wait_for(window.full.wait(), self.max_wait)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._close(service, window)
+                # Shielded so that cancelling the leader (client disconnect,
+                # timeout) cannot strand the other callers in its window
+                flush = asyncio.ensure_future(self._flush(service, window))
+                self._flushes.add(flush)
+                flush.add_done_callback(self._flushes.discard)
+                try:
+                    await asyncio.shield(flush)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+
+        return await future
+
+    def _close(self, service: Any, window: _Window) -> None:
+        if self._windows.get(service) is window:
+            del self._windows[service]
+
+    async def _flush(self, service: Any, window: _Window) -> None:
+        records = [record for record, _ in window.items]
+        try:
+            # Scoring is CPU-bound; keep it off the event loop
+            outcomes = await run_in_threadpool(service.predict_many, records)
+        except Exception as e:
+            logger.error(f"Micro-batch of {len(records)} failed: {e}")
+            outcomes = [e] * len(records)
+
+        for (_, future), outcome in zip(window.items, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    @staticmethod
+    def _unwrap(outcome: Any) -> dict:
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+# Global instance
+_batcher_instance: Optional[AsyncBatcher] = None
+
+
+def get_batcher_instance() -> AsyncBatcher:
+    global _batcher_instance
+    if _batcher_instance is None:
+        _batcher_instance = AsyncBatcher(
+            max_batch_size=int(os.getenv("PREDICT_MAX_BATCH", "32")),
+            max_wait_ms=float(os.getenv("PREDICT_MAX_WAIT_MS", "5")),
+        )
+    return _batcher_instance
@@ -0,0 +1,58 @@
+# app/utils/cache.py
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class PredictionCache:
+    """Bounded LRU of prediction results keyed by a hash of the application
+
+    Retried or re-submitted applications hash to the same key, so they are
+    answered without touching the pipeline. Safe to share across threads.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(record: dict) -> bytes:
+        """Stable key: equal applications give equal keys whatever the field order"""
+        payload = json.dumps(record, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[dict]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Hand out a copy so callers cannot alter the cached entry
+        return dict(result)
+
+    def put(self, key: bytes, result: dict) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = dict(result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
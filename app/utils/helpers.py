@@ -1,19 +1,31 @@
 # app/utils/helpers.py
+import bisect
 import json
 import logging
+import math
 import joblib
 import pandas as pd
 import numpy as np
+import os
 import platform
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Union
 import pickle
 
+from joblib import Parallel, delayed
 from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.preprocessing import KBinsDiscretizer
 from sklearn.tree import DecisionTreeClassifier
 
+from app.utils.cache import PredictionCache
+from app.utils.kernels import ScoreBuffers, score_batch
+
 logger = logging.getLogger(__name__)
 
+# Parallel jobs for per-feature work in WOETransformer.fit (-1 = all cores)
+WOE_N_JOBS = int(os.getenv("WOE_N_JOBS", "-1"))
+
 
 class ColumnDropper(BaseEstimator, TransformerMixin):
     """Drops columns that are non-predictive or contain data leakage"""
@@ -66,10 +78,8 @@ class ColumnDropper(BaseEstimator, TransformerMixin):
         return self
 
     def transform(self, X):
-        X = X.copy()
-        # Only drop columns that exist in the dataframe
-        cols_to_drop = [col for col in self.drop_cols if col in X.columns]
-        X = X.drop(columns=cols_to_drop)
+        # Only drop columns that exist in the dataframe (drop returns a new frame)
+        X = X.drop(columns=X.columns.intersection(self.drop_cols))
         return X
 
 
@@ -80,18 +90,20 @@ class FeatureEngineer(BaseEstimator, TransformerMixin):
         return self
 
     def transform(self, X):
-        X = X.copy()
-
-        # ✅ Use provided credit_history_length directly
-        # (no need to compute from issue_d / earliest_cr_line)
-        X = X.drop(columns=["issue_d", "earliest_cr_line"], errors="ignore")
-
         # ✅ Create loan burden ratio if needed
+        loan_burden = None
         if "loan_amnt" in X.columns and "annual_inc" in X.columns:
-            X["loan_burden"] = X["loan_amnt"] / (X["annual_inc"] + 1)
-
-        # ✅ Drop redundant columns if they exist
-        X = X.drop(columns=["loan_amnt", "dti"], errors="ignore")
+            loan_burden = X["loan_amnt"] / (X["annual_inc"] + 1)
+
+        # ✅ Drop redundant columns if they exist, in one call. Use provided
+        # credit_history_length directly (no need for issue_d / earliest_cr_line).
+        # drop returns a new frame, so the caller's X is never modified
+        X = X.drop(
+            columns=["issue_d", "earliest_cr_line", "loan_amnt", "dti"],
+            errors="ignore",
+        )
+        if loan_burden is not None:
+            X["loan_burden"] = loan_burden
 
         return X
 
@@ -126,6 +138,7 @@ class MissingValueImputer(BaseEstimator, TransformerMixin):
 
     def fit(self, X, y=None):
         X = X.copy()
+        self._fill_values_cache = None
         # Identify numerical and categorical columns
         numerical_cols = [
             col
@@ -138,40 +151,41 @@ class MissingValueImputer(BaseEstimator, TransformerMixin):
             if col == "emp_length" and col in X.columns
         ]
 
-        # Fit numerical imputers
-        for col in numerical_cols:
-            if X[col].dropna().shape[0] > 0:
-                self.median_values[col] = X[col].median()
-            else:
-                self.median_values[col] = 0  # fallback if all values are NaN
+        # Fit numerical imputers (all medians in one call)
+        medians = X[numerical_cols].median()
+        self.median_values = medians.fillna(0).to_dict()  # 0 if all values are NaN
 
-        # Fit categorical imputer
-        for col in categorical_cols:
-            if X[col].dropna().shape[0] > 0:
-                self.mode_values[col] = X[col].mode(dropna=True)[0]
-            else:
-                self.mode_values[col] = "Unknown"  # fallback if all values are NaN
+        # Fit categorical imputer (all modes in one call)
+        if categorical_cols:
+            modes = X[categorical_cols].mode(dropna=True)
+            modes = modes.iloc[0] if len(modes) else pd.Series(index=categorical_cols)
+            # "Unknown" if all values are NaN
+            self.mode_values = modes.astype(object).fillna("Unknown").to_dict()
 
         return self
 
+    def _fill_values(self):
+        """Medians and modes merged once into the dict fillna takes"""
+        fill_values = self.__dict__.get("_fill_values_cache")
+        if fill_values is None:
+            fill_values = {**self.median_values, **self.mode_values}
+            self._fill_values_cache = fill_values
+        return fill_values
+
     def transform(self, X):
-        X = X.copy()
-        # Impute numerical columns
-        for col, median_val in self.median_values.items():
-            if col in X.columns:
-                X[col] = X[col].fillna(median_val)
-        # Impute categorical columns
-        for col, mode_val in self.mode_values.items():
-            if col in X.columns:
-                X[col] = X[col].fillna(mode_val)
-        return X
+        # Impute numerical and categorical columns in a single fillna pass;
+        # fillna skips keys that are not columns of X
+        return X.fillna(self._fill_values())
 
 
 class WOETransformer(BaseEstimator, TransformerMixin):
     """Applies Weight of Evidence (WOE) transformation to features"""
 
-    def __init__(self, max_leaf_nodes=5):
+    def __init__(self, max_leaf_nodes=5, binning="tree"):
         self.max_leaf_nodes = max_leaf_nodes
+        # "tree": supervised decision-tree splits; "quantile": equal-frequency
+        # bins from KBinsDiscretizer (cheaper, ignores the target)
+        self.binning = binning
         self.features_to_bin = [
             "annual_inc",
             "int_rate",
@@ -207,7 +221,9 @@ class WOETransformer(BaseEstimator, TransformerMixin):
 
     def decision_tree_binning(self, X, y):
         """Create bins using decision tree"""
-        X_reshaped = X.values.reshape(-1, 1)
+        # sklearn trees split on float32 internally; converting here saves a
+        # float64 copy of the column
+        X_reshaped = X.to_numpy(dtype=np.float32).reshape(-1, 1)
         tree = DecisionTreeClassifier(
             criterion="entropy",
             max_leaf_nodes=self.max_leaf_nodes,
@@ -221,25 +237,111 @@ class WOETransformer(BaseEstimator, TransformerMixin):
         bins = [-np.inf] + sorted(thresholds.tolist()) + [np.inf]
         return bins
 
+    def quantile_binning(self, X, y=None):
+        """Create equal-frequency bins using KBinsDiscretizer"""
+        disc = KBinsDiscretizer(
+            n_bins=self.max_leaf_nodes,
+            encode="ordinal",
+            strategy="quantile",
+            subsample=None,
+        )
+        disc.fit(X.dropna().to_numpy(dtype=np.float64).reshape(-1, 1))
+
+        # Skewed columns can repeat a quantile; keep each edge once
+        thresholds = np.unique(disc.bin_edges_[0][1:-1])
+
+        bins = [-np.inf] + thresholds.tolist() + [np.inf]
+        return bins
+
+    def __setstate__(self, state):
+        # Pipelines pickled before the binning option existed used the tree
+        state.setdefault("binning", "tree")
+        super().__setstate__(state)
+
     def calc_woe_iv(self, df, feature_bin_col, target_col="target"):
-        """Calculate WOE and IV for a feature"""
-        grouped = df.groupby(feature_bin_col)[target_col].agg(["count", "sum"])
-        grouped.columns = ["total", "bad"]
-        grouped["good"] = grouped["total"] - grouped["bad"]
+        """Calculate WOE and IV for a feature
+
+        Bad and total counts per bin come from two np.bincount passes over
+        integer bin codes. Like groupby, empty categorical bins are kept and
+        missing values are left out.
+        """
+        values = df[feature_bin_col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            codes, uniques = pd.factorize(values, sort=True)
+        seen = codes >= 0
+        codes = codes[seen]
+        y = df[target_col].to_numpy(dtype=np.float64)[seen]
+
+        total = np.bincount(codes, minlength=len(uniques))
+        bad = np.bincount(codes, weights=y, minlength=len(uniques))
+        good = total - bad
 
-        dist_good = grouped["good"] / grouped["good"].sum()
-        dist_bad = grouped["bad"] / grouped["bad"].sum()
+        dist_good = good / good.sum()
+        dist_bad = bad / bad.sum()
 
-        grouped["woe"] = np.log((dist_good + 1e-6) / (dist_bad + 1e-6))
-        grouped["iv"] = (dist_good - dist_bad) * grouped["woe"]
+        woe = np.log((dist_good + 1e-6) / (dist_bad + 1e-6))
+        iv = (dist_good - dist_bad) * woe
 
-        woe_dict = grouped["woe"].to_dict()
-        iv_score = grouped["iv"].sum()
+        woe_dict = dict(zip(uniques, woe.tolist()))
+        iv_score = iv.sum()
 
         return woe_dict, iv_score
 
+    def _categorical_table(self, feature):
+        """Cached (categories, WOE array) lookup for a categorical feature
+
+        The float32 WOE array carries a trailing NaN so unknown categories
+        (code -1) map to NaN, like dict-based .map() does.
+        """
+        tables = self.__dict__.setdefault("_woe_tables", {})
+        if feature not in tables:
+            mapping = self.woe_mappings[feature]
+            categories = pd.Index(list(mapping.keys()))
+            woes = np.append(
+                np.asarray(list(mapping.values()), dtype=np.float32),
+                np.float32(np.nan),
+            )
+            tables[feature] = (categories, woes)
+        return tables[feature]
+
+    def calc_all_woe_iv(self, df, feature_cols, target_col="target", n_jobs=WOE_N_JOBS):
+        """Calculate WOE and IV for several features in parallel
+
+        Each joblib job gets only its feature and the target column. A
+        feature that fails is returned as its exception, so the rest still
+        complete.
+        """
+        outcomes = Parallel(n_jobs=n_jobs)(
+            delayed(_or_error)(self.calc_woe_iv, df[[col, target_col]], col, target_col)
+            for col in feature_cols
+        )
+        return dict(zip(feature_cols, outcomes))
+
+    def _numeric_table(self, feature):
+        """Cached (inner bin edges, WOE array) lookup for a binned numeric feature
+
+        Bins are right-closed like pd.cut, so np.searchsorted(edges, x, "left")
+        gives the bin of x directly. The float32 WOE array carries a trailing
+        NaN for missing values.
+        """
+        tables = self.__dict__.setdefault("_woe_tables", {})
+        if feature not in tables:
+            bins = self.bins[feature]
+            mapping = self.woe_mappings[feature]
+            # woe_mappings is keyed by pd.cut's labels, which round the edges
+            labels = pd.cut(pd.Series([], dtype=np.float64), bins=bins).cat.categories
+            woes = [mapping.get(label, np.nan) for label in labels]
+            tables[feature] = (
+                np.asarray(bins[1:-1], dtype=np.float64),
+                np.append(np.asarray(woes, dtype=np.float32), np.float32(np.nan)),
+            )
+        return tables[feature]
+
     def fit(self, X, y=None):
         X = X.copy()
+        self._woe_tables = {}
 
         # If target is in X, extract it for WOE calculation
         if "target" not in X.columns:
@@ -247,63 +349,75 @@ class WOETransformer(BaseEstimator, TransformerMixin):
             return self
 
         target_col = X["target"]
+        binners = {
+            "tree": self.decision_tree_binning,
+            "quantile": self.quantile_binning,
+        }
+        if self.binning not in binners:
+            raise ValueError(f"Unknown binning method: {self.binning}")
 
-        # Bin numerical features
-        for feature in self.features_to_bin:
-            if feature in X.columns:
-                try:
-                    bins = self.decision_tree_binning(X[feature], target_col)
-                    self.bins[feature] = bins
-                    X[feature + "_bin"] = pd.cut(X[feature], bins=bins)
-                except Exception as e:
-                    print(f"Could not bin {feature}: {e}")
-
-        # Calculate WOE for binned numerical features
-        for feature in self.features_to_bin:
-            bin_col = feature + "_bin"
-            if bin_col in X.columns:
-                try:
-                    woe_map, iv_score = self.calc_woe_iv(X, bin_col, "target")
-                    self.woe_mappings[feature] = woe_map
-                    print(f"✅ WOE calculated for {feature}, IV = {iv_score:.4f}")
-                except Exception as e:
-                    print(f"❌ Failed WOE calculation for {feature}: {e}")
-
-        # Calculate WOE for categorical features
-        for cat_feature in self.categorical_features:
-            if cat_feature in X.columns:
-                try:
-                    woe_map, iv_score = self.calc_woe_iv(X, cat_feature, "target")
-                    self.woe_mappings[cat_feature] = woe_map
-                    print(f"✅ WOE calculated for {cat_feature}, IV = {iv_score:.4f}")
-                except Exception as e:
-                    print(f"❌ Failed WOE calculation for {cat_feature}: {e}")
+        # Bin numerical features in parallel threads (sklearn releases the GIL)
+        to_bin = [f for f in self.features_to_bin if f in X.columns]
+        binned = Parallel(n_jobs=WOE_N_JOBS, prefer="threads")(
+            delayed(_or_error)(binners[self.binning], X[f], target_col) for f in to_bin
+        )
+        for feature, bins in zip(to_bin, binned):
+            try:
+                if isinstance(bins, Exception):
+                    raise bins
+                self.bins[feature] = bins
+                X[feature + "_bin"] = pd.cut(X[feature], bins=bins)
+            except Exception as e:
+                print(f"Could not bin {feature}: {e}")
+
+        # Calculate WOE for binned numerical and categorical features at once
+        woe_cols = {f + "_bin": f for f in self.features_to_bin}
+        woe_cols.update({f: f for f in self.categorical_features})
+        woe_cols = {col: f for col, f in woe_cols.items() if col in X.columns}
+        outcomes = self.calc_all_woe_iv(X, list(woe_cols), "target")
+        for col, feature in woe_cols.items():
+            if isinstance(outcomes[col], Exception):
+                print(f"❌ Failed WOE calculation for {feature}: {outcomes[col]}")
+                continue
+            woe_map, iv_score = outcomes[col]
+            self.woe_mappings[feature] = woe_map
+            print(f"✅ WOE calculated for {feature}, IV = {iv_score:.4f}")
 
         return self
 
     def transform(self, X):
-        X = X.copy()
+        # WOE columns are added to X in place. Inside the pipeline X is the
+        # imputer's freshly filled frame, so no defensive copy is needed
 
         # Apply binning and WOE to numerical features
         for feature in self.features_to_bin:
             if feature in X.columns and feature in self.bins:
-                X[feature + "_bin"] = pd.cut(X[feature], bins=self.bins[feature])
                 if feature in self.woe_mappings:
-                    X[feature + "_woe"] = X[feature + "_bin"].map(
-                        self.woe_mappings[feature]
-                    )
+                    edges, woes = self._numeric_table(feature)
+                    values = X[feature].to_numpy(dtype=np.float64)
+                    codes = np.searchsorted(edges, values, side="left")
+                    codes[np.isnan(values)] = len(woes) - 1
+                    X[feature + "_woe"] = woes[codes]
 
         # Apply WOE to categorical features
         for cat_feature in self.categorical_features:
             if cat_feature in X.columns and cat_feature in self.woe_mappings:
-                X[cat_feature + "_woe"] = X[cat_feature].map(
-                    self.woe_mappings[cat_feature]
-                )
+                categories, woes = self._categorical_table(cat_feature)
+                codes = categories.get_indexer(X[cat_feature])
+                X[cat_feature + "_woe"] = woes[codes]
 
         # Return all columns including target if it exists
         return X
 
 
+def _or_error(func, *args):
+    """Run one parallel job, returning its exception instead of raising it"""
+    try:
+        return func(*args)
+    except Exception as e:
+        return e
+
+
 # Custom unpickler for pipelines
 class CustomUnpickler(pickle.Unpickler):
     def find_class(self, module, name):
@@ -327,26 +441,19 @@ class CreditRiskService:
         self.metadata_path = Path(model_dir) / "model_metadata.json"
         self.scorecard_path = Path(model_dir) / "scorecard.csv"
 
-        # --- custom class resolver for pipeline unpickling ---
-        # custom_classes = {
-        #     "ColumnDropper": ColumnDropper,
-        #     "FeatureEngineer": FeatureEngineer,
-        #     "MissingValueImputer": MissingValueImputer,
-        #     "WOETransformer": WOETransformer,
-        # }
-
         # --- load model ---
         try:
-            self.model = joblib.load(self.model_path)
+            # Read-only memory map: model arrays live in the shared page cache
+            # instead of being copied into every worker process
+            self.model = joblib.load(self.model_path, mmap_mode="r")
             logger.info(f"✅ Loaded model from {self.model_path}")
         except Exception as e:
             logger.error(f"❌ Failed to load model: {e}")
             raise
 
-        # --- load pipeline with custom unpickler ---
+        # --- load pipeline ---
         try:
-            with open(self.pipeline_path, "rb") as f:
-                self.pipeline = CustomUnpickler(f).load()
+            self.pipeline = self._load_pipeline()
             logger.info(f"✅ Loaded preprocessing pipeline from {self.pipeline_path}")
         except Exception as e:
             logger.error(f"❌ Failed to load pipeline: {e}")
@@ -360,6 +467,7 @@ class CreditRiskService:
         except Exception as e:
             logger.warning(f"⚠️ Metadata not found: {e}")
             self.metadata = {}
+        self.version = self.metadata.get("version", "1.0.0")
 
         # --- load scorecard (optional) ---
         try:
@@ -369,15 +477,145 @@ class CreditRiskService:
             self.scorecard = None
             logger.warning("⚠️ Scorecard not found, continuing without it")
 
-        # --- prediction ---
+        # --- specialize the pipeline to the model's fixed feature schema ---
+        self._specialize_pipeline()
+
+        # --- score scaling (fixed for the lifetime of the model) ---
+        pdo = self.metadata.get("PDO", 20)
+        base_score = self.metadata.get("BaseScore", 600)
+        base_odds = self.metadata.get("BaseOdds", 50)
+        self.factor_ = pdo / math.log(2)
+        self.offset_ = base_score - self.factor_ * math.log(base_odds)
+
+        # --- float32 scoring parameters ---
+        # WOE values and 9 coefficients need nowhere near float64 precision;
+        # float32 halves the bytes streamed through the batch dot product
+        self.coef_ = self.model.coef_.astype(np.float32).ravel()
+        self.intercept_ = np.float32(self.model.intercept_[0])
+        self._check_float32_parity()
+
+        # Per-thread scratch arrays reused across predict_many calls
+        self._scratch = threading.local()
+
+        # Results for recently seen applications (retries, re-submissions)
+        self.cache = PredictionCache(int(os.getenv("PREDICTION_CACHE_SIZE", "10000")))
+
+    def _load_pipeline(self):
+        """Load the pipeline with joblib, falling back to CustomUnpickler
+
+        Notebook exports reference the transformers under __main__ and need
+        CustomUnpickler; scripts/repickle_pipeline.py converts them.
+        """
+        try:
+            return joblib.load(self.pipeline_path, mmap_mode="r")
+        except AttributeError:
+            logger.warning(
+                "⚠️ Pipeline was pickled from __main__; run "
+                "scripts/repickle_pipeline.py to load it with joblib"
+            )
+            with open(self.pipeline_path, "rb") as f:
+                return CustomUnpickler(f).load()
+
+    def _score_buffers(self) -> ScoreBuffers:
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None:
+            buffers = self._scratch.buffers = ScoreBuffers()
+        return buffers
+
+    def _specialize_pipeline(self) -> None:
+        """Only compute WOE columns the model actually reads
+
+        The WOE step was fitted on more features than the final model uses
+        (open_acc, term, emp_length, ...). Serving never needs those columns,
+        so drop them from the transformer once at load time.
+        """
+        woe = self.pipeline.named_steps.get("woe_transformer")
+        features = self.metadata.get("features")
+        if woe is None or not features:
+            return
+        used = {f[: -len("_woe")] for f in features if f.endswith("_woe")}
+        woe.features_to_bin = [f for f in woe.features_to_bin if f in used]
+        woe.categorical_features = [f for f in woe.categorical_features if f in used]
+        logger.info(
+            f"✅ WOE step limited to {len(woe.features_to_bin)} numeric and "
+            f"{len(woe.categorical_features)} categorical features"
+        )
+
+    def _check_float32_parity(self, n_samples: int = 10000) -> None:
+        """Log how far float32 scoring drifts from float64 on sampled WOE rows"""
+        try:
+            woe = self.pipeline.named_steps["woe_transformer"]
+            features = self.metadata.get("features", [])
+            rng = np.random.default_rng(0)
+            X = np.column_stack(
+                [
+                    rng.choice(
+                        list(woe.woe_mappings[f[: -len("_woe")]].values()), n_samples
+                    )
+                    for f in features
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Skipping float32 parity check: {e}")
+            return
+
+        p64 = self.model.predict_proba(pd.DataFrame(X, columns=features))[:, 1]
+        _, p32, _ = score_batch(
+            X.astype(np.float32), self.coef_, float(self.intercept_), 1, 0
+        )
+        drift = float(np.max(np.abs(p64 - p32)))
+        if drift > 1e-4:
+            logger.warning(
+                f"⚠️ float32 scoring drifts from float64: max |Δp| = {drift:.2e}"
+            )
+        else:
+            logger.info(f"✅ float32 scoring parity: max |Δp| = {drift:.2e}")
 
     def predict(self, input_dict: dict) -> dict:
         """Generate credit risk prediction for a single applicant"""
-        X = pd.DataFrame([input_dict])
-
         logger.info(
             f"Raw verification_status received: {input_dict.get('verification_status')}"
         )
+        result = self.predict_many([input_dict])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def predict_many(
+        self, records: Union[List[dict], pd.DataFrame]
+    ) -> List[Union[dict, Exception]]:
+        """Generate credit risk predictions for a batch of applicants in one pass
+
+        Accepts a list of application dicts or a DataFrame with one row per
+        application. Rows that cannot be scored are returned as exceptions in
+        place of a result, so one bad application does not fail the whole batch.
+        Dict records already seen recently are answered from the cache.
+        """
+        if len(records) == 0:
+            return []
+        if isinstance(records, pd.DataFrame):
+            return self._score(records.reset_index(drop=True))
+
+        keys = [PredictionCache.key(record) for record in records]
+        cached = [self.cache.get(k) for k in keys]
+        misses = [i for i, hit in enumerate(cached) if hit is None]
+        scored = iter(
+            self._score(pd.DataFrame([records[i] for i in misses])) if misses else []
+        )
+
+        results: List[Union[dict, Exception]] = []
+        for key, hit in zip(keys, cached):
+            if hit is not None:
+                results.append(hit)
+                continue
+            outcome = next(scored)
+            if isinstance(outcome, dict):
+                self.cache.put(key, outcome)
+            results.append(outcome)
+        return results
+
+    def _score(self, X: pd.DataFrame) -> List[Union[dict, Exception]]:
+        """Run the pipeline and model over a frame of raw applications"""
         X["verification_status"] = X["verification_status"].str.strip().str.title()
 
         # --- preprocessing ---
@@ -396,67 +634,67 @@ class CreditRiskService:
 
         X_proc = X_proc[trained_features]
 
-        # Debug step
-        if X_proc.isnull().any().any():
+        # Rows with NaNs after preprocessing cannot be scored
+        valid = X_proc.notna().all(axis=1).to_numpy()
+        if not valid.all():
             logger.error("NaNs detected in processed features!")
             logger.error(f"NaN columns: {list(X_proc.columns[X_proc.isnull().any()])}")
-            logger.error(f"Row values: {X_proc.to_dict(orient='records')}")
-            raise ValueError("Processed data contains NaNs")
+            logger.error(f"Row values: {X_proc[~valid].to_dict(orient='records')}")
 
-        # --- prediction ---
+        # --- prediction (one dot product for the whole batch) ---
+        X_valid = X_proc.to_numpy(dtype=np.float32)[valid]
         try:
-            prob = self.model.predict_proba(X_proc)[:, 1][0]
+            log_odds, prob, score = score_batch(
+                X_valid,
+                self.coef_,
+                float(self.intercept_),
+                self.factor_,
+                self.offset_,
+                out=self._score_buffers().take(len(X_valid)),
+            )
         except Exception as e:
             logger.error(f"❌ Model prediction failed: {e}")
             raise
 
-        # --- score scaling ---
-        pdo = self.metadata.get("PDO", 20)
-        base_score = self.metadata.get("BaseScore", 600)
-        base_odds = self.metadata.get("BaseOdds", 50)
+        levels = scores_to_risk_levels(score).tolist()
+        scored = iter(zip(score.tolist(), prob.tolist(), log_odds.tolist(), levels))
+        results: List[Union[dict, Exception]] = []
+        for is_valid in valid:
+            if not is_valid:
+                results.append(ValueError("Processed data contains NaNs"))
+                continue
+            row_score, row_prob, row_log_odds, row_level = next(scored)
+            results.append(
+                {
+                    "credit_score": round(row_score, 2),
+                    "default_probability": round(row_prob, 4),
+                    "risk_level": row_level,
+                    "log_odds": round(row_log_odds, 4),
+                }
+            )
+        return results
 
-        factor = pdo / np.log(2)
-        offset = base_score - factor * np.log(base_odds)
-
-        # Clamp probability to avoid numerical issues at extremes
-        # This prevents log(0) or log(inf) issues
-        prob_clamped = np.clip(prob, 1e-6, 1 - 1e-6)
-        log_odds = np.log(prob_clamped / (1 - prob_clamped))
-        score = offset - factor * log_odds
-
-        # Clamp score to reasonable bounds (typical credit score range: 300-900)
-        # This ensures scores stay within interpretable range
-        score = np.clip(score, 300, 900)
-
-        # --- risk level from credit score (standard credit rating scale) ---
-        # Map credit score to standard S&P/Moody's/Fitch rating scale
-        if score >= 750:
-            risk_level = "AAA"
-        elif score >= 700:
-            risk_level = "AA"
-        elif score >= 650:
-            risk_level = "A"
-        elif score >= 600:
-            risk_level = "BBB"
-        elif score >= 550:
-            risk_level = "BB"
-        elif score >= 500:
-            risk_level = "B"
-        elif score >= 450:
-            risk_level = "CCC"
-        elif score >= 400:
-            risk_level = "CC"
-        elif score >= 350:
-            risk_level = "C"
-        else:
-            risk_level = "D"
+    def predict_many_iter(
+        self, records: List[dict], chunk_size: int = 32
+    ) -> Iterator[Union[dict, Exception]]:
+        """Yield predictions row by row, scoring chunk_size rows at a time"""
+        for start in range(0, len(records), chunk_size):
+            yield from self.predict_many(records[start : start + chunk_size])
 
-        return {
-            "credit_score": round(score, 2),
-            "default_probability": round(prob, 4),
-            "risk_level": risk_level,
-            "log_odds": round(log_odds, 4),
-        }
+
+# Lower score bound of each rating, from D (below 350) up to AAA (750+)
+RISK_THRESHOLDS = [350, 400, 450, 500, 550, 600, 650, 700, 750]
+RISK_LEVELS = np.array(["D", "C", "CC", "CCC", "B", "BB", "BBB", "A", "AA", "AAA"])
+
+
+def score_to_risk_level(score: float) -> str:
+    """Map credit score to standard S&P/Moody's/Fitch rating scale"""
+    return str(RISK_LEVELS[bisect.bisect_right(RISK_THRESHOLDS, score)])
+
+
+def scores_to_risk_levels(scores: np.ndarray) -> np.ndarray:
+    """Vectorized score_to_risk_level for a whole batch of scores"""
+    return RISK_LEVELS[np.searchsorted(RISK_THRESHOLDS, scores, side="right")]
 
 
 # Global instance
@@ -506,6 +744,9 @@ def get_api_metadata():
             "/api/v1/health",
             "/api/v1/predict",
             "/api/v1/predict/batch",
+            "/api/v1/predict/batch/stream",
+            "/api/v1/predict/batch/arrow",
             "/api/v1/model/info",
+            "/api/v1/metrics",
         ],
     }
@@ -0,0 +1,63 @@
+# app/utils/kernels.py
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy.special import expit
+
+# Log odds of the 1e-6 / 1 - 1e-6 probability clamp used by the scorecard
+LOGIT_BOUND = float(np.log((1 - 1e-6) / 1e-6))
+
+ScoreArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class ScoreBuffers:
+    """Reusable float64 output arrays for score_batch, grown on demand
+
+    Not thread-safe: give each thread its own instance.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self._alloc(capacity)
+
+    def _alloc(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._arrays = np.empty((3, capacity), dtype=np.float64)
+
+    def take(self, n: int) -> ScoreArrays:
+        """(log_odds, prob, score) views of length n; valid until the next take"""
+        if n > self.capacity:
+            self._alloc(max(n, 2 * self.capacity))
+        log_odds, prob, score = self._arrays[:, :n]
+        return log_odds, prob, score
+
+
+def score_batch(
+    X: np.ndarray,
+    coef: np.ndarray,
+    intercept: float,
+    factor: float,
+    offset: float,
+    out: Optional[ScoreArrays] = None,
+) -> ScoreArrays:
+    """Score WOE feature rows in one pass
+
+    Returns (log_odds, default_probability, credit_score) arrays, written into
+    ``out`` when given. Clamping the log odds directly is equivalent to
+    clamping the probability and taking log(p / (1 - p)), without the extra log
+    and divide. The dot product runs in the dtype of X and coef (float32 in
+    serving); everything after it runs in float64 so scores keep their
+    two-decimal precision.
+    """
+    if out is None:
+        out = ScoreBuffers(len(X)).take(len(X))
+    log_odds, prob, score = out
+
+    np.matmul(X, coef, out=log_odds)
+    log_odds += intercept
+    expit(log_odds, out=prob)
+    np.clip(log_odds, -LOGIT_BOUND, LOGIT_BOUND, out=log_odds)
+    # Clamp score to reasonable bounds (typical credit score range: 300-900)
+    np.multiply(log_odds, -factor, out=score)
+    score += offset
+    np.clip(score, 300, 900, out=score)
+    return log_odds, prob, score
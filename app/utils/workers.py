@@ -0,0 +1,61 @@
+# app/utils/workers.py
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Union
+
+from threadpoolctl import threadpool_limits
+
+from app.utils.helpers import CreditRiskService
+
+logger = logging.getLogger(__name__)
+
+# Batches larger than this are split across the process pool
+PROCESS_POOL_THRESHOLD = int(os.getenv("PROCESS_POOL_THRESHOLD", "5000"))
+PROCESS_POOL_WORKERS = int(os.getenv("PROCESS_POOL_WORKERS", str(os.cpu_count() or 1)))
+
+# Service loaded once in each worker process by init_worker
+_worker_service: Optional[CreditRiskService] = None
+
+
+def init_worker(model_dir: str = "models") -> None:
+    """Process pool initializer: load the artifacts once per worker"""
+    global _worker_service
+    # Each worker gets its own core; stop BLAS from spawning threads on top
+    threadpool_limits(1)
+    _worker_service = CreditRiskService(model_dir)
+
+
+def score_chunk(records: List[dict]) -> List[Union[dict, Exception]]:
+    """Score one chunk of a large batch inside a worker process"""
+    if _worker_service is None:
+        raise RuntimeError("score_chunk called in a process init_worker has not set up")
+    return _worker_service.predict_many(records)
+
+
+def create_process_pool(model_dir: str = "models") -> ProcessPoolExecutor:
+    """Pool for very large batches; workers start on first use"""
+    # spawn, not fork: the server process already runs threads
+    return ProcessPoolExecutor(
+        max_workers=PROCESS_POOL_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(model_dir,),
+    )
+
+
+async def predict_in_pool(
+    pool: ProcessPoolExecutor, records: List[dict]
+) -> List[Union[dict, Exception]]:
+    """Split a large batch into chunks and score them across the process pool"""
+    size = -(-len(records) // PROCESS_POOL_WORKERS)
+    loop = asyncio.get_running_loop()
+    chunks = await asyncio.gather(
+        *[
+            loop.run_in_executor(pool, score_chunk, records[i : i + size])
+            for i in range(0, len(records), size)
+        ]
+    )
+    return [outcome for chunk in chunks for outcome in chunk]
@@ -0,0 +1,33 @@
+# scripts/repickle_pipeline.py
+"""Re-save a notebook-exported preprocessing pipeline as a plain joblib file
+
+Pipelines pickled from the training notebook reference the transformer
+classes as ``__main__.ColumnDropper`` etc., so they can only be read through
+CustomUnpickler. Re-saving them from here records the importable
+``app.utils.helpers`` paths, letting the service use ``joblib.load`` with
+``mmap_mode="r"``.
+
+Usage: python -m scripts.repickle_pipeline [models/preprocessing_pipeline.joblib]
+"""
+import sys
+from pathlib import Path
+
+import joblib
+
+from app.utils.helpers import CustomUnpickler
+
+
+def repickle(path: Path) -> None:
+    with open(path, "rb") as f:
+        pipeline = CustomUnpickler(f).load()
+    # Uncompressed, so numpy arrays in the pipeline can be memory-mapped
+    joblib.dump(pipeline, path, compress=0)
+    print(f"✅ Re-saved {path} with importable class paths")
+
+
+if __name__ == "__main__":
+    repickle(
+        Path(
+            sys.argv[1] if len(sys.argv) > 1 else "models/preprocessing_pipeline.joblib"
+        )
+    )
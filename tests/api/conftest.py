@@ -0,0 +1,92 @@
+from typing import Iterator, List, Union
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import app.api.routes as routes
+from app.main import app as fastapi_app
+from app.utils.cache import PredictionCache
+
+
+# A loan application that passes LoanApplicationRequest validation
+VALID_PAYLOAD = {
+    "annual_inc": 75000,
+    "int_rate": 12.5,
+    "credit_history_length": 5.5,
+    "purpose": "debt_consolidation",
+    "verification_status": "Verified",
+}
+
+
+class FakeCreditRiskService:
+    def __init__(self):
+        self.metadata = {
+            "version": "test-1.0.0",
+            "features": [
+                "int_rate_woe",
+                "total_rev_hi_lim_woe",
+                "tot_cur_bal_woe",
+                "annual_inc_woe",
+                "purpose_woe",
+                "loan_burden_woe",
+                "credit_history_length_woe",
+                "revol_util_woe",
+                "verification_status_woe",
+            ],
+            "PDO": 20,
+            "BaseScore": 600,
+            "BaseOdds": 50,
+            "training_date": "2024-01-01",
+            "risk_prob_thresholds": {"low": 0.05, "medium": 0.15, "high": 0.3},
+        }
+        self.version = self.metadata["version"]
+        self.cache = PredictionCache()
+
+    def predict(self, input_dict: dict) -> dict:
+        if input_dict.get("int_rate") == 13.37:
+            raise ValueError("Synthetic failure")
+        # Return deterministic values for assertions
+        return {
+            "credit_score": 650.0,
+            "default_probability": 0.1,
+            "risk_level": "A",  # Score 650 maps to "A" rating
+            "log_odds": -2.1972,
+        }
+
+    def predict_many(self, records) -> List[Union[dict, Exception]]:
+        if isinstance(records, pd.DataFrame):
+            records = records.to_dict(orient="records")
+        results: List[Union[dict, Exception]] = []
+        for record in records:
+            try:
+                results.append(self.predict(record))
+            except ValueError as e:
+                results.append(e)
+        return results
+
+    def predict_many_iter(self, records, chunk_size: int = 32):
+        yield from self.predict_many(records)
+
+
+@pytest.fixture()
+def valid_payload() -> dict:
+    # A fresh copy, so tests can change fields freely
+    return dict(VALID_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def fake_service() -> FakeCreditRiskService:
+    return FakeCreditRiskService()
+
+
+@pytest.fixture(scope="session")
+def client(fake_service: FakeCreditRiskService) -> Iterator[TestClient]:
+    # Handlers look up routes.get_model at call time; patch it for the session
+    # and undo the patch on teardown
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(routes, "get_model", lambda request: fake_service)
+
+        # One app lifespan (startup/shutdown) for the whole test session
+        with TestClient(fastapi_app) as test_client:
+            yield test_client
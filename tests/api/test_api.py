@@ -0,0 +1,169 @@
+import json
+
+import pyarrow as pa
+import pytest
+
+import app.api.routes as routes
+
+
+def test_health_ok(client):
+    res = client.get("/api/v1/health")
+    assert res.status_code == 200
+    body = res.json()
+    assert body["status"] == "healthy"
+    assert body["model_loaded"] is True
+    assert "version" in body
+
+
+def test_predict_ok(client, valid_payload):
+    res = client.post("/api/v1/predict", json=valid_payload)
+    assert res.status_code == 200
+    data = res.json()
+    assert data["credit_score"] == 650.0
+    assert data["default_probability"] == 0.1
+    assert data["risk_level"] == "A"  # Score 650 maps to "A" rating
+    assert "message" in data
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("annual_inc", -100),  # out of range: negative income
+        ("int_rate", "not-a-number"),  # wrong type
+        ("purpose", "vacation"),  # not a LoanPurpose
+        ("credit_history_length", None),  # required field missing
+    ],
+)
+def test_predict_validation_error(client, valid_payload, field, value):
+    if value is None:
+        del valid_payload[field]
+    else:
+        valid_payload[field] = value
+    res = client.post("/api/v1/predict", json=valid_payload)
+    assert res.status_code == 422
+
+
+def test_predict_internal_error_from_service(client, valid_payload):
+    # special int_rate triggers the fake service error
+    valid_payload["int_rate"] = 13.37
+    res = client.post("/api/v1/predict", json=valid_payload)
+    # routes.py catches and maps to 500
+    assert res.status_code == 500
+
+
+# (int_rate, purpose, expected risk level); 13.37 fails inside the fake service
+# and a score of 650 maps to "A"
+MIXED_BATCH_CASES = [
+    (10.0, "car", "A"),
+    (13.37, "credit_card", "Error"),
+    (8.5, "home_improvement", "A"),
+]
+
+
+def test_predict_batch_mixed_results(client, valid_payload):
+    # Every case goes out in a single batch request
+    payload = {
+        "applications": [
+            {**valid_payload, "int_rate": int_rate, "purpose": purpose}
+            for int_rate, purpose, _ in MIXED_BATCH_CASES
+        ]
+    }
+    res = client.post("/api/v1/predict/batch", json=payload)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["total_applications"] == len(MIXED_BATCH_CASES)
+    assert [p["risk_level"] for p in body["predictions"]] == [
+        expected for _, _, expected in MIXED_BATCH_CASES
+    ]
+
+
+def test_model_info(client):
+    res = client.get("/api/v1/model/info")
+    assert res.status_code == 200
+    info = res.json()
+    assert info["model_type"].startswith("Logistic Regression")
+    assert isinstance(info["features_used"], list)
+    assert set(["PDO", "BaseScore", "BaseOdds"]).issubset(info["scoring_params"].keys())
+
+
+def test_metrics_reports_prediction_cache(client):
+    res = client.get("/api/v1/metrics")
+    assert res.status_code == 200
+    assert {"hits", "misses", "hit_rate"} <= res.json()["prediction_cache"].keys()
+
+
+def test_health_is_cached_between_polls(client, fake_service, monkeypatch):
+    # Start from an empty cache so earlier health calls do not decide the outcome
+    monkeypatch.setitem(routes._health_cache, "t", float("-inf"))
+    monkeypatch.setitem(routes._health_cache, "resp", None)
+    monkeypatch.setattr(routes, "HEALTH_CACHE_TTL", 60.0)
+    lookups = []
+
+    def counting_get_model(request):
+        lookups.append(request)
+        return fake_service
+
+    monkeypatch.setattr(routes, "get_model", counting_get_model)
+    first = client.get("/api/v1/health").json()
+    second = client.get("/api/v1/health").json()
+    assert len(lookups) == 1
+    assert first == second == routes._health_cache["resp"].model_dump()
+
+
+def _arrow_body(columns):
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def test_predict_batch_arrow_mixed_results(client):
+    body = _arrow_body(
+        {
+            "annual_inc": [70000.0, 70000.0, -5.0],
+            "int_rate": [10.0, 13.37, 10.0],
+            "credit_history_length": [4.0, 8.0, 4.0],
+            "purpose": ["car", "credit_card", "car"],
+            "verification_status": ["Verified", "Verified", "Verified"],
+        }
+    )
+    res = client.post(
+        "/api/v1/predict/batch/arrow",
+        content=body,
+        headers={"content-type": "application/vnd.apache.arrow.stream"},
+    )
+    assert res.status_code == 200
+    preds = pa.ipc.open_stream(res.content).read_all().to_pylist()
+    assert [p["risk_level"] for p in preds] == ["A", "Error", "Error"]
+    assert preds[1]["message"] == "Synthetic failure"
+    assert preds[2]["message"] == "Invalid value for annual_inc"
+
+
+def test_predict_batch_arrow_missing_column(client):
+    body = _arrow_body({"annual_inc": [70000.0]})
+    res = client.post("/api/v1/predict/batch/arrow", content=body)
+    assert res.status_code == 400
+
+
+def test_arrow_batch_schema(client):
+    res = client.get("/api/v1/predict/batch/arrow/schema")
+    assert res.status_code == 200
+    body = res.json()
+    assert [f["name"] for f in body["request"]][:3] == [
+        "annual_inc",
+        "int_rate",
+        "credit_history_length",
+    ]
+    assert body["media_type"] == "application/vnd.apache.arrow.stream"
+
+
+def test_predict_batch_stream_ndjson(client, valid_payload):
+    failing = {**valid_payload, "int_rate": 13.37}
+    payload = {"applications": [valid_payload, failing, valid_payload]}
+    res = client.post("/api/v1/predict/batch/stream", json=payload)
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in res.text.splitlines()]
+    assert [r["risk_level"] for r in rows] == ["A", "Error", "A"]
+    assert rows[1]["message"] == "Synthetic failure"
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from app.api.arrow import validate_applications
+
+
+def test_validate_applications_reports_first_bad_field():
+    df = pd.DataFrame(
+        {
+            "annual_inc": [75000.0, 0.0, np.nan, 75000.0, 75000.0],
+            "int_rate": [12.5, 12.5, 12.5, 12.5, 12.5],
+            "credit_history_length": [5.5, 5.5, 5.5, 101.0, 5.5],
+            "total_rev_hi_lim": [np.nan, np.nan, np.nan, np.nan, -1.0],
+            "tot_cur_bal": np.nan,
+            "purpose": ["car", "car", "car", "car", "not_a_purpose"],
+            "loan_burden": np.nan,
+            "revol_util": np.nan,
+            "verification_status": ["Verified"] * 5,
+            "loan_amount": np.nan,
+        }
+    )
+    assert validate_applications(df).tolist() == [
+        None,
+        "Invalid value for annual_inc",
+        "Invalid value for annual_inc",
+        "Invalid value for credit_history_length",
+        "Invalid value for total_rev_hi_lim",
+    ]
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.utils.batcher import AsyncBatcher
+
+
+class RecordingService:
+    def __init__(self):
+        self.calls = []
+
+    def predict_many(self, records):
+        self.calls.append(len(records))
+        return [
+            ValueError("bad row") if r["id"] < 0 else {"id": r["id"]} for r in records
+        ]
+
+
+def test_concurrent_submits_share_one_call():
+    service = RecordingService()
+    batcher = AsyncBatcher(max_batch_size=8, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(
+            *[batcher.submit(service, {"id": i}) for i in range(3)]
+        )
+
+    results = asyncio.run(run())
+    assert results == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert service.calls == [3]
+
+
+def test_full_window_flushes_before_timeout():
+    service = RecordingService()
+    batcher = AsyncBatcher(max_batch_size=2, max_wait_ms=10_000)
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(*[batcher.submit(service, {"id": i}) for i in range(4)]),
+            timeout=1,
+        )
+
+    assert len(asyncio.run(run())) == 4
+    assert service.calls == [2, 2]
+
+
+def test_row_error_is_raised_to_its_caller_only():
+    service = RecordingService()
+    batcher = AsyncBatcher(max_batch_size=8, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.submit(service, {"id": 1}),
+            batcher.submit(service, {"id": -1}),
+            return_exceptions=True,
+        )
+
+    ok, err = asyncio.run(run())
+    assert ok == {"id": 1}
+    assert isinstance(err, ValueError)
+
+
+def test_zero_wait_scores_immediately():
+    service = RecordingService()
+    batcher = AsyncBatcher(max_batch_size=8, max_wait_ms=0)
+    assert asyncio.run(batcher.submit(service, {"id": 5})) == {"id": 5}
+    with pytest.raises(ValueError):
+        asyncio.run(batcher.submit(service, {"id": -5}))
+
+
+class BlockingService(RecordingService):
+    """Holds predict_many open until released, so a flush can be interrupted"""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def predict_many(self, records):
+        self.started.set()
+        self.release.wait(timeout=5)
+        return super().predict_many(records)
+
+
+def test_cancelled_leader_still_resolves_followers():
+    service = BlockingService()
+    batcher = AsyncBatcher(max_batch_size=2, max_wait_ms=10_000)
+
+    async def run():
+        leader = asyncio.ensure_future(batcher.submit(service, {"id": 0}))
+        follower = asyncio.ensure_future(batcher.submit(service, {"id": 1}))
+        # Wait until the flush is scoring in the threadpool, then cancel the leader
+        await asyncio.get_running_loop().run_in_executor(None, service.started.wait)
+        leader.cancel()
+        await asyncio.sleep(0)
+        service.release.set()
+        result = await asyncio.wait_for(follower, timeout=2)
+        return leader.cancelled(), result
+
+    assert asyncio.run(run()) == (True, {"id": 1})
@@ -0,0 +1,22 @@
+from app.utils.cache import PredictionCache
+
+
+def test_key_ignores_field_order():
+    a = {"annual_inc": 75000.0, "purpose": "car"}
+    b = {"purpose": "car", "annual_inc": 75000.0}
+    assert PredictionCache.key(a) == PredictionCache.key(b)
+    assert PredictionCache.key(a) != PredictionCache.key({**a, "purpose": "house"})
+
+
+def test_evicts_least_recently_used_and_counts_hits():
+    cache = PredictionCache(maxsize=2)
+    cache.put(b"a", {"score": 1})
+    cache.put(b"b", {"score": 2})
+    assert cache.get(b"a") == {"score": 1}  # "b" is now least recently used
+    cache.put(b"c", {"score": 3})
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"c") == {"score": 3}
+    stats = cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (2, 2, 1)
+    assert stats["hit_rate"] == round(2 / 3, 4)
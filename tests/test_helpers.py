@@ -1,4 +1,17 @@
-from app.utils.helpers import get_api_metadata, validate_environment, setup_logging
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.helpers import (
+    MissingValueImputer,
+    WOETransformer,
+    get_api_metadata,
+    score_to_risk_level,
+    scores_to_risk_levels,
+    setup_logging,
+    validate_environment,
+)
+from app.utils.cache import PredictionCache
 
 
 def test_get_api_metadata():
@@ -15,3 +28,155 @@ def test_setup_logging_idempotent():
     logger1 = setup_logging()
     logger2 = setup_logging()
     assert logger1.name == logger2.name
+
+
+def _application(**overrides):
+    record = {
+        "annual_inc": 75000.0,
+        "int_rate": 12.5,
+        "credit_history_length": 5.5,
+        "total_rev_hi_lim": None,
+        "tot_cur_bal": None,
+        "purpose": "debt_consolidation",
+        "loan_burden": None,
+        "revol_util": None,
+        "verification_status": "Verified",
+        "loan_amount": None,
+    }
+    record.update(overrides)
+    return record
+
+
+@pytest.fixture()
+def uncached_service(service, monkeypatch):
+    # Equivalence checks must score every pass, not read back the first one
+    monkeypatch.setattr(service, "cache", PredictionCache(0))
+    return service
+
+
+def test_predict_many_matches_single_predictions(uncached_service):
+    records = [_application(), _application(int_rate=5.0, annual_inc=150000.0)]
+    results = uncached_service.predict_many(records)
+    assert results == [uncached_service.predict(r) for r in records]
+
+
+def test_predict_many_flags_unscorable_rows(service):
+    results = service.predict_many([_application(), _application(purpose="unknown")])
+    assert results[0]["risk_level"] != "Error"
+    assert isinstance(results[1], ValueError)
+
+
+def test_woe_categorical_lookup_matches_mapping(service):
+    woe = service.pipeline.named_steps["woe_transformer"]
+    purposes = pd.Series(["car", "other", "not_a_purpose", None, "car"])
+    out = woe.transform(pd.DataFrame({"purpose": purposes}))
+    expected = purposes.map(woe.woe_mappings["purpose"])
+    pd.testing.assert_series_equal(
+        out["purpose_woe"], expected.astype(np.float32), check_names=False
+    )
+
+
+def test_woe_numeric_lookup_matches_pd_cut(service):
+    woe = service.pipeline.named_steps["woe_transformer"]
+    bins = woe.bins["int_rate"]
+    rates = pd.Series([1.0, *bins[1:-1], 12.0, 30.0, np.nan])
+    out = woe.transform(pd.DataFrame({"int_rate": rates}))
+    expected = pd.cut(rates, bins=bins).map(woe.woe_mappings["int_rate"])
+    np.testing.assert_array_equal(out["int_rate_woe"], expected.astype(np.float32))
+
+
+def test_predict_many_iter_matches_predict_many(uncached_service):
+    records = [_application(int_rate=rate) for rate in (6.0, 9.0, 12.0, 16.0, 20.0)]
+    assert list(uncached_service.predict_many_iter(records, chunk_size=2)) == (
+        uncached_service.predict_many(records)
+    )
+
+
+def test_service_scores_with_float32_parameters(service):
+    assert service.coef_.dtype == np.float32
+    np.testing.assert_allclose(service.coef_, service.model.coef_.ravel(), rtol=1e-6)
+
+
+def test_repeated_application_is_served_from_cache(service):
+    record = _application(int_rate=7.25)
+    first = service.predict_many([record])[0]
+    hits = service.cache.hits
+    assert service.predict_many([dict(reversed(record.items()))])[0] == first
+    assert service.cache.hits == hits + 1
+
+
+def test_risk_levels_follow_rating_boundaries():
+    scores = [300.0, 349.99, 350.0, 499.5, 500.0, 649.99, 700.0, 750.0, 900.0]
+    expected = ["D", "D", "C", "CCC", "B", "BBB", "AA", "AAA", "AAA"]
+    assert [score_to_risk_level(s) for s in scores] == expected
+    assert scores_to_risk_levels(np.array(scores)).tolist() == expected
+
+
+# Shared across runs; calc_woe_iv only reads its input
+_WOE_DF = pd.DataFrame(
+    {
+        "grade": ["b", "a", "a", "c", None, "b", "a", "c"],
+        "target": [1, 0, 0, 1, 1, 0, 1, 0],
+    }
+)
+
+
+def test_calc_woe_iv_matches_groupby():
+    grouped = _WOE_DF.groupby("grade")["target"].agg(["count", "sum"])
+    dist_good = (grouped["count"] - grouped["sum"]) / 4
+    dist_bad = grouped["sum"] / 3
+    woe = np.log((dist_good + 1e-6) / (dist_bad + 1e-6))
+
+    woe_dict, iv_score = WOETransformer().calc_woe_iv(_WOE_DF, "grade")
+    assert list(woe_dict) == ["a", "b", "c"]
+    np.testing.assert_allclose(list(woe_dict.values()), woe.to_numpy())
+    assert iv_score == pytest.approx(((dist_good - dist_bad) * woe).sum())
+
+
+def test_imputer_fills_all_columns_in_one_pass():
+    imputer = MissingValueImputer().fit(
+        pd.DataFrame(
+            {
+                "annual_inc": [10.0, 20.0, 90.0],
+                "revol_util": [np.nan] * 3,
+                "emp_length": ["1 year", "1 year", None],
+            }
+        )
+    )
+    assert imputer.median_values == {"annual_inc": 20.0, "revol_util": 0}
+    out = imputer.transform(
+        pd.DataFrame(
+            {"annual_inc": [np.nan], "revol_util": [np.nan], "emp_length": [None]}
+        )
+    )
+    assert out.iloc[0].tolist() == [20.0, 0.0, "1 year"]
+
+
+def test_calc_all_woe_iv_matches_per_feature_calls():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "grade": rng.choice(["a", "b", "c"], 200),
+            "term": rng.choice([" 36 months", " 60 months"], 200),
+            "target": rng.integers(0, 2, 200),
+        }
+    )
+    woe = WOETransformer()
+    outcomes = woe.calc_all_woe_iv(df, ["grade", "term"], n_jobs=2)
+    assert outcomes == {
+        "grade": woe.calc_woe_iv(df, "grade"),
+        "term": woe.calc_woe_iv(df, "term"),
+    }
+
+
+def test_quantile_binning_fits_equal_frequency_bins():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"int_rate": rng.uniform(5, 25, 1000)})
+    df["target"] = rng.integers(0, 2, 1000)
+    woe = WOETransformer(binning="quantile").fit(df)
+
+    bins = woe.bins["int_rate"]
+    assert len(bins) == woe.max_leaf_nodes + 1
+    counts = pd.cut(df["int_rate"], bins=bins).value_counts()
+    assert counts.min() >= 190
+    assert woe.transform(df)["int_rate_woe"].notna().all()
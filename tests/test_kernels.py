@@ -0,0 +1,36 @@
+import numpy as np
+
+from app.utils.kernels import LOGIT_BOUND, ScoreBuffers, score_batch
+
+
+def test_score_batch_matches_model_probabilities(service):
+    model = service.model
+    X = np.random.default_rng(0).normal(0, 0.5, size=(16, model.coef_.shape[1]))
+    log_odds, prob, score = score_batch(
+        X, model.coef_.ravel(), model.intercept_[0], 20 / np.log(2), 500
+    )
+    np.testing.assert_allclose(prob, model.predict_proba(X)[:, 1])
+    np.testing.assert_allclose(
+        score, np.clip(500 - 20 / np.log(2) * log_odds, 300, 900)
+    )
+
+
+def test_score_batch_clamps_extremes():
+    X = np.array([[100.0], [-100.0]])
+    log_odds, prob, score = score_batch(X, np.array([1.0]), 0.0, 28.85, 600.0)
+    np.testing.assert_allclose(log_odds, [LOGIT_BOUND, -LOGIT_BOUND])
+    assert score[0] == 300 and score[1] == 900
+
+
+def test_score_buffers_are_reused_and_grow():
+    buffers = ScoreBuffers(capacity=2)
+    coef = np.array([1.0], dtype=np.float32)
+    X = np.array([[0.0], [1.0]], dtype=np.float32)
+    first = score_batch(X, coef, 0.0, 20.0, 600.0, out=buffers.take(2))
+    assert np.shares_memory(first[0], buffers.take(2)[0])
+
+    X = np.zeros((5, 1), dtype=np.float32)
+    _, prob, score = score_batch(X, coef, 0.0, 20.0, 600.0, out=buffers.take(5))
+    assert buffers.capacity >= 5
+    np.testing.assert_allclose(prob, 0.5)
+    np.testing.assert_allclose(score, 600.0)
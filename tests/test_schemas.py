@@ -4,16 +4,17 @@ from pydantic import ValidationError
 from app.api.schemas import LoanApplicationRequest, LoanPurpose, VerificationStatus
 
 
+_BASE_REQUEST = {
+    "annual_inc": 75000,
+    "int_rate": 12.5,
+    "credit_history_length": 5.5,
+    "purpose": LoanPurpose.DEBT_CONSOLIDATION.value,
+    "verification_status": VerificationStatus.VERIFIED.value,
+}
+
+
 def make_valid_request(**overrides):
-    base = {
-        "annual_inc": 75000,
-        "int_rate": 12.5,
-        "credit_history_length": 5.5,
-        "purpose": LoanPurpose.DEBT_CONSOLIDATION.value,
-        "verification_status": VerificationStatus.VERIFIED.value,
-    }
-    base.update(overrides)
-    return base
+    return {**_BASE_REQUEST, **overrides}
 
 
 def test_schema_valid_minimal():
@@ -28,6 +29,7 @@ def test_schema_valid_minimal():
     [
         ("annual_inc", 0),
         ("annual_inc", -1),
+        ("annual_inc", 20_000_000),
         ("int_rate", -0.1),
         ("int_rate", 55.0),
         ("credit_history_length", -0.5),
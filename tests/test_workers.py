@@ -0,0 +1,27 @@
+import asyncio
+
+from app.utils.workers import create_process_pool, predict_in_pool
+
+
+def test_predict_in_pool_matches_in_process_scoring(service):
+    records = [
+        {
+            "annual_inc": 40000.0 + 5000 * i,
+            "int_rate": 6.0 + i,
+            "credit_history_length": 5.5,
+            "total_rev_hi_lim": None,
+            "tot_cur_bal": None,
+            "purpose": "debt_consolidation",
+            "loan_burden": None,
+            "revol_util": None,
+            "verification_status": "Verified",
+            "loan_amount": None,
+        }
+        for i in range(10)
+    ]
+    pool = create_process_pool()
+    try:
+        results = asyncio.run(predict_in_pool(pool, records))
+    finally:
+        pool.shutdown()
+    assert results == service.predict_many(records)